@@ -23,13 +23,15 @@ License: MIT
 
 import os
 import sys
+import json
+import time
 from pathlib import Path
 import argparse
 import logging
 import subprocess
 import shutil
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +39,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ASF search results are cached next to the downloads so reruns can skip
+# the API call when every scene of the previous search is already on disk
+SEARCH_CACHE_FILE = 'asf_search_cache.json'
+SEARCH_CACHE_MAX_AGE = 24 * 3600  # seconds
+
 
 def print_warning():
     """Print experimental warning"""
@@ -77,6 +84,86 @@ def create_aoi_geojson(min_lon: float, min_lat: float,
     }
 
 
+def asf_filename_candidates(result) -> List[str]:
+    """
+    Local .zip names an ASF search result may be saved under
+
+    ASF downloads are named after properties['fileName'], while older
+    downloads in this pipeline used properties['fileID'] + '.zip'.
+
+    Args:
+        result: ASF search result
+
+    Returns:
+        Candidate filenames, preferred name first
+    """
+    candidates = []
+    file_name = result.properties.get('fileName')
+    if file_name:
+        if not file_name.endswith('.zip'):
+            file_name += '.zip'
+        candidates.append(file_name)
+
+    file_id_name = result.properties['fileID'] + '.zip'
+    if file_id_name not in candidates:
+        candidates.append(file_id_name)
+
+    return candidates
+
+
+def list_filenames(directory: Path) -> Set[str]:
+    """List the entry names in a directory with a single scan"""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+def load_search_cache(download_dir: Path, query: Dict) -> Optional[List[List[str]]]:
+    """
+    Load cached ASF search results for a query
+
+    Args:
+        download_dir: Directory holding the downloads and the cache file
+        query: Search parameters the cache must have been written for
+
+    Returns:
+        Filename candidates per scene, or None if there is no fresh cache entry
+    """
+    cache_file = download_dir / SEARCH_CACHE_FILE
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cache.get('query') != query:
+        return None
+    if time.time() - cache.get('timestamp', 0) > SEARCH_CACHE_MAX_AGE:
+        return None
+
+    return cache.get('scenes')
+
+
+def save_search_cache(download_dir: Path, query: Dict, scenes: List[List[str]]):
+    """
+    Save ASF search results for a query
+
+    Args:
+        download_dir: Directory holding the downloads and the cache file
+        query: Search parameters the results belong to
+        scenes: Filename candidates for each scene returned by the search
+    """
+    cache = {
+        'query': query,
+        'timestamp': time.time(),
+        'scenes': scenes
+    }
+    try:
+        with open(download_dir / SEARCH_CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not write search cache: {e}")
+
+
 def search_and_download_asf(aoi_geojson: Dict, start_date: str, end_date: str,
                             download_dir: Path, max_results: int = 50) -> List[Path]:
     """
@@ -111,6 +198,28 @@ def search_and_download_asf(aoi_geojson: Dict, start_date: str, end_date: str,
     logger.info(f"AOI: {aoi_wkt[:100]}...")
     logger.info(f"Period: {start_date} to {end_date}")
 
+    # Skip the search entirely if a recent identical search has already
+    # been fully downloaded
+    query = {
+        'aoi': aoi_wkt,
+        'start': start_date,
+        'end': end_date,
+        'max_results': max_results
+    }
+    cached_scenes = load_search_cache(download_dir, query)
+    if cached_scenes and download_dir.is_dir():
+        existing = list_filenames(download_dir)
+        cached_files = []
+        for candidates in cached_scenes:
+            name = next((c for c in candidates if c in existing), None)
+            if name is None:
+                break
+            cached_files.append(download_dir / name)
+        else:
+            logger.info(f"All {len(cached_files)} scenes from cached search "
+                        f"already downloaded, skipping ASF search")
+            return cached_files
+
     # Search ASF
     try:
         results = asf.search(
@@ -145,22 +254,29 @@ def search_and_download_asf(aoi_geojson: Dict, start_date: str, end_date: str,
     logger.info("=" * 60)
 
     download_dir.mkdir(parents=True, exist_ok=True)
+    # Normalize ASF's filename conventions once per result
+    scene_candidates = [asf_filename_candidates(result) for result in results]
+    save_search_cache(download_dir, query, scene_candidates)
     downloaded = []
 
-    for i, result in enumerate(results):
-        filename = result.properties['fileID'] + '.zip'
-        filepath = download_dir / filename
+    # List the download directory once instead of stat-ing every result
+    existing = list_filenames(download_dir)
+
+    for i, (result, candidates) in enumerate(zip(results, scene_candidates)):
+        filename = next((c for c in candidates if c in existing), None)
 
-        if filepath.exists():
+        if filename is not None:
             logger.info(f"[{i+1}/{len(results)}] Already exists: {filename}")
-            downloaded.append(filepath)
+            downloaded.append(download_dir / filename)
             continue
 
-        logger.info(f"[{i+1}/{len(results)}] Downloading: {filename}")
+        logger.info(f"[{i+1}/{len(results)}] Downloading: {candidates[0]}")
 
         try:
             result.download(path=str(download_dir))
-            if filepath.exists():
+            filepath = next((download_dir / c for c in candidates
+                             if (download_dir / c).exists()), None)
+            if filepath is not None:
                 downloaded.append(filepath)
                 logger.info(f"  ✓ Downloaded")
             else:
@@ -21,11 +21,19 @@ Usage:
 
 import os
 import sys
+import math
+import time
+import fnmatch
+import importlib.util
 from pathlib import Path
 import logging
 import argparse
 import subprocess
-from typing import List
+import shutil
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Tuple
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +41,326 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of threads each SNAP GPT process uses (gpt -q)
+GPT_PARALLELISM = 16
+
+# dB values are stored as Int16 scaled by this factor (-15.35 dB -> -1535),
+# matching the GEE data format
+DB_SCALE_FACTOR = 100
+
+# GeoTIFF creation options shared by every mosaic output (besides COMPRESS,
+# set from --mosaic-compression), so single-scene and multi-scene mosaics
+# end up with the same on-disk layout. Horizontal differencing shrinks the
+# Int16 data and GDAL compresses tiles in parallel
+MOSAIC_CREATION_OPTIONS = [
+    'PREDICTOR=2',
+    'TILED=YES',
+    'BLOCKXSIZE=512',
+    'BLOCKYSIZE=512',
+    'NUM_THREADS=ALL_CPUS',
+    'BIGTIFF=YES',
+]
+
+# Overview levels built into the mosaic, so previews and GIS viewers read
+# a reduced-resolution copy instead of decoding every full-resolution tile
+MOSAIC_OVERVIEW_FACTORS = [2, 4, 8, 16, 32, 64]
+
+# How long a newly started GPT run keeps its full memory budget reserved,
+# until its JVM has grown and shows up in MemAvailable (seconds)
+GPT_MEMORY_RAMP_TIME = 300
+
+# GDAL caching for the tile-by-tile GeoTIFF conversion: a larger block cache
+# plus VSI read caching avoids re-reading the same SNAP .img blocks
+GDAL_READ_OPTIONS = {
+    'GDAL_CACHEMAX': 1024,  # MB
+    'VSI_CACHE': True,
+    'VSI_CACHE_SIZE': 128 * 1024 * 1024,  # bytes per file
+}
+
+
+def list_files(directory: Path, pattern: str) -> List[Path]:
+    """
+    List regular files in a directory matching a glob pattern
+
+    Uses a single os.scandir pass; names and file types come from the
+    directory listing itself, so no per-file stat is needed.
+
+    Args:
+        directory: Directory to list
+        pattern: fnmatch-style pattern (e.g. '*.zip')
+
+    Returns:
+        Sorted list of matching file paths
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path) for entry in entries
+            if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()
+        )
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a SNAP/Java style memory size ('16G', '512M') into bytes
+
+    Args:
+        size: Size with optional K/M/G/T suffix
+
+    Returns:
+        Size in bytes
+    """
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+    size = size.strip().upper().rstrip('B')
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+
+def gpt_memory(cache_size: str) -> int:
+    """
+    Memory budget of one GPT process in bytes
+
+    Twice its tile cache, to cover the cache plus JVM heap and native
+    overhead.
+
+    Args:
+        cache_size: SNAP cache size per GPT process (e.g. '16G')
+    """
+    return 2 * parse_size(cache_size)
+
+
+def available_memory() -> Optional[int]:
+    """
+    Currently available system memory in bytes
+
+    Returns:
+        MemAvailable from /proc/meminfo, or None if unknown (non-Linux)
+    """
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def cpu_load() -> Optional[float]:
+    """
+    One-minute system load average
+
+    Returns:
+        Load average, or None if unknown (non-Unix)
+    """
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+def auto_workers(cache_size: str) -> int:
+    """
+    Estimate how many GPT processes the machine can run concurrently
+
+    Each GPT process is budgeted gpt_memory() and GPT_PARALLELISM threads.
+
+    Args:
+        cache_size: SNAP cache size per GPT process (e.g. '16G')
+
+    Returns:
+        Number of workers (at least 1)
+    """
+    try:
+        total_memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        # os.sysconf is not available on Windows
+        return 1
+
+    by_memory = total_memory // gpt_memory(cache_size)
+    by_cpu = (os.cpu_count() or 1) // GPT_PARALLELISM
+    return max(1, min(by_memory, by_cpu))
+
+
+def split_cpus(parts: int) -> Optional[List[List[int]]]:
+    """
+    Split the CPUs available to this process into disjoint sets
+
+    Args:
+        parts: Number of sets
+
+    Returns:
+        List of CPU id lists, one per set (empty if there are fewer CPUs
+        than sets), or None if affinity is unsupported
+    """
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS/Windows
+        return None
+
+    per_part = len(cpus) // parts
+    if per_part == 0:
+        return []
+    return [cpus[n * per_part:(n + 1) * per_part] for n in range(parts)]
+
+
+def drop_page_cache(path: Path):
+    """
+    Advise the kernel that a file's cached pages won't be needed again
+
+    Inputs are read once, sequentially; dropping them from the page cache
+    keeps it free for data that is still in use. No-op where
+    posix_fadvise is unavailable.
+
+    Args:
+        path: File that has been fully consumed
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def conversion_available() -> bool:
+    """
+    Check that the packages needed for GeoTIFF conversion are installed
+
+    Returns:
+        True if rasterio and numpy can be imported (logs an error otherwise)
+    """
+    missing = [name for name in ('rasterio', 'numpy')
+               if importlib.util.find_spec(name) is None]
+    if missing:
+        logger.error(f"Required packages not installed: {', '.join(missing)}")
+        return False
+    return True
+
+
+def set_db_scale(dataset):
+    """
+    Record the Int16 dB scaling as band scale/offset metadata
+
+    Lets GDAL-aware readers recover dB values (value * scale + offset).
+
+    Args:
+        dataset: rasterio dataset opened for writing
+    """
+    dataset.scales = (1 / DB_SCALE_FACTOR,) * dataset.count
+    dataset.offsets = (0.0,) * dataset.count
+
+
+class GptAdmission:
+    """
+    Decide when another SNAP GPT run may start
+
+    While other runs are going, a new one waits if the machine is short of
+    memory (instead of letting the JVMs push it into swap) or if other jobs
+    on a shared host already keep every CPU busy. Runs started recently
+    have their full memory budget reserved, because their JVMs take a
+    while to grow and MemAvailable doesn't reflect them yet.
+    """
+
+    def __init__(self, needed_memory: int, load_limit: float):
+        """
+        Args:
+            needed_memory: Memory budget of one GPT process in bytes
+            load_limit: Load from other processes at which new runs wait
+        """
+        self.needed_memory = needed_memory
+        self.load_limit = load_limit
+        self.condition = threading.Condition()
+        self.running = 0
+        self.started = []  # start times of running GPT runs
+        self.released = []  # (start, finish) times of recent GPT runs
+
+    def reserved_memory(self) -> int:
+        """
+        Memory promised to runs whose JVMs may not have grown yet
+
+        Returns:
+            Memory budget of the runs started in the last
+            GPT_MEMORY_RAMP_TIME seconds, in bytes
+        """
+        now = time.monotonic()
+        recent = [t for t in self.started if now - t < GPT_MEMORY_RAMP_TIME]
+        return len(recent) * self.needed_memory
+
+    def other_load(self) -> Optional[float]:
+        """
+        System load not caused by the GPT runs started here
+
+        Returns:
+            Estimated load from other processes, or None if unknown
+        """
+        load = cpu_load()
+        if load is None:
+            return None
+        # Each GPT keeps about GPT_PARALLELISM threads runnable, but the
+        # one-minute load average follows that with a 60 s time constant:
+        # a run that just started has barely shown up yet, and one that
+        # just finished still counts
+        now = time.monotonic()
+        self.released = [(start, finish) for start, finish in self.released
+                         if now - finish < 300]
+        own = sum(GPT_PARALLELISM * (1 - math.exp(-(now - start) / 60))
+                  for start in self.started)
+        own += sum(GPT_PARALLELISM * (1 - math.exp(-(finish - start) / 60))
+                   * math.exp(-(now - finish) / 60)
+                   for start, finish in self.released)
+        return load - own
+
+    def admit(self, name: str) -> float:
+        """
+        Block until a run may start, then count it as running
+
+        Args:
+            name: Scene name for the log message
+
+        Returns:
+            Start time of the run, to be passed to release()
+        """
+        with self.condition:
+            waiting = False
+            while self.running > 0:
+                available = available_memory()
+                if available is not None:
+                    available -= self.reserved_memory()
+                load = self.other_load()
+                if available is not None and available < self.needed_memory:
+                    reason = f"memory ({max(available, 0) / 1e9:.1f} GB unreserved)"
+                elif load is not None and load >= self.load_limit:
+                    reason = f"CPUs (load {load:.1f} from other processes)"
+                else:
+                    break
+                if not waiting:
+                    logger.info(f"  Waiting for {reason} before starting {name}")
+                    waiting = True
+                self.condition.wait(timeout=30)
+            self.running += 1
+            started = time.monotonic()
+            self.started.append(started)
+            return started
+
+    def release(self, started: float):
+        """
+        Mark a run as finished and wake up waiting ones
+
+        Args:
+            started: Start time returned by admit()
+        """
+        with self.condition:
+            self.running -= 1
+            self.started.remove(started)
+            self.released.append((started, time.monotonic()))
+            self.condition.notify_all()
+
 
 class PeriodDirectoryProcessor:
     """
@@ -42,7 +370,11 @@ class PeriodDirectoryProcessor:
     def __init__(self, period_dir: str = '.',
                  snap_gpt_path: str = '/home/unika_sianturi/work/idmai/esa-snap/bin/gpt',
                  graph_xml: str = '/home/unika_sianturi/work/rice-growth-stage-mapping/sen1_preprocessing-gpt-20m.xml',
-                 cache_size: str = '16G'):
+                 cache_size: str = '16G',
+                 workers: int = 1,
+                 geotiff_compression: str = 'lzw',
+                 mosaic_compression: str = 'lzw',
+                 pin_cpus: bool = False):
         """
         Initialize processor
 
@@ -50,12 +382,24 @@ class PeriodDirectoryProcessor:
             period_dir: Period directory (e.g., p15/)
             snap_gpt_path: Path to SNAP GPT executable
             graph_xml: SNAP processing graph XML file
-            cache_size: SNAP cache size
+            cache_size: SNAP cache size (per GPT process)
+            workers: Number of scenes preprocessed (and converted)
+                concurrently (0 = estimate from available memory and CPUs)
+            geotiff_compression: Compression of the per-scene GeoTIFFs
+                ('lzw' or 'none'); they are only read once by the mosaic step
+            mosaic_compression: Compression of the mosaic ('lzw' or 'zstd');
+                ZSTD decodes faster but needs GDAL >= 2.3 to read
+            pin_cpus: Pin concurrent GPT processes to disjoint CPU sets
+                (Linux, requires taskset)
         """
         self.period_dir = Path(period_dir).resolve()
         self.snap_gpt_path = snap_gpt_path
         self.graph_xml = graph_xml
         self.cache_size = cache_size
+        self.workers = workers if workers > 0 else auto_workers(cache_size)
+        self.geotiff_compression = geotiff_compression
+        self.mosaic_compression = mosaic_compression
+        self.pin_cpus = pin_cpus
 
         # Setup directories
         self.downloads_dir = self.period_dir / 'downloads'
@@ -70,11 +414,19 @@ class PeriodDirectoryProcessor:
 
         logger.info(f"Period Directory Processor")
         logger.info(f"Working directory: {self.period_dir}")
+        if workers <= 0:
+            logger.info(f"Workers: {self.workers} (estimated from memory and CPUs)")
 
-    def step1_preprocess(self) -> bool:
+    def step1_preprocess(self,
+                         on_processed: Optional[Callable[[Path], None]] = None) -> bool:
         """
         Preprocess all downloads with SNAP GPT
 
+        Args:
+            on_processed: Optional callback invoked with the .dim path of
+                every scene as soon as it is available (already processed
+                or just finished), used to overlap conversion with GPT
+
         Returns:
             True if successful, False otherwise
         """
@@ -88,60 +440,154 @@ class PeriodDirectoryProcessor:
             return False
 
         # Get all ZIP files
-        zip_files = sorted(self.downloads_dir.glob('*.zip'))
+        zip_files = list_files(self.downloads_dir, '*.zip')
         if not zip_files:
             logger.warning(f"No ZIP files found in {self.downloads_dir}")
             return False
 
         logger.info(f"Found {len(zip_files)} ZIP files")
 
+        # Scan preprocessed outputs once instead of stat-ing each scene
+        already_processed = {p.stem for p in list_files(self.preprocessed_dir, '*.dim')}
+
         # Process each file
         success_count = 0
+        pending = []
         for i, zip_file in enumerate(zip_files, 1):
             output_name = zip_file.stem + '_processed'
             output_file = self.preprocessed_dir / output_name
 
             # Check if already processed
-            if (output_file.with_suffix('.dim')).exists():
+            if output_name in already_processed:
                 logger.info(f"[{i}/{len(zip_files)}] Already processed: {output_name}")
                 success_count += 1
+                if on_processed:
+                    on_processed(output_file.with_suffix('.dim'))
                 continue
 
-            logger.info(f"[{i}/{len(zip_files)}] Processing: {zip_file.name}")
+            pending.append((i, zip_file, output_file))
+
+        # Start the largest scenes first so smaller ones backfill the
+        # workers at the end instead of one large scene running alone
+        pending.sort(key=lambda item: item[1].stat().st_size, reverse=True)
+
+        # Optionally give each concurrently running GPT its own CPU set so
+        # the JVMs don't compete for (and migrate across) the same cores
+        cpu_slots = None
+        if self.pin_cpus and self.workers > 1 and pending:
+            cpu_sets = split_cpus(self.workers)
+            if cpu_sets is None or not shutil.which('taskset'):
+                logger.warning("CPU pinning not supported on this system, ignoring --pin-cpus")
+            elif not cpu_sets:
+                logger.warning(f"Fewer CPUs than workers ({self.workers}), ignoring --pin-cpus")
+            else:
+                cpu_slots = queue.Queue()
+                for cpus in cpu_sets:
+                    cpu_slots.put(cpus)
+                logger.info(f"Pinning GPT processes to {len(cpu_sets[0])} CPUs each")
+
+        # The GeoTIFF converter threads (one per worker in --run-all) also
+        # add to the load, so allow roughly one runnable thread each
+        admission = GptAdmission(gpt_memory(self.cache_size),
+                                 (os.cpu_count() or 1) + self.workers)
+
+        def process(i: int, zip_file: Path, output_file: Path) -> bool:
+            started = admission.admit(zip_file.name)
+            try:
+                logger.info(f"[{i}/{len(zip_files)}] Processing: {zip_file.name}")
+                if cpu_slots is None:
+                    return self._preprocess_scene(zip_file, output_file)
+
+                cpus = cpu_slots.get()
+                try:
+                    return self._preprocess_scene(zip_file, output_file, cpus)
+                finally:
+                    cpu_slots.put(cpus)
+            finally:
+                admission.release(started)
+
+        # GPT runs as a subprocess, so threads are enough to run several
+        # scenes at once
+        if pending and self.workers > 1:
+            logger.info(f"Preprocessing {len(pending)} scenes with {self.workers} workers")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(process, i, zip_file, output_file): output_file
+                for i, zip_file, output_file in pending
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                    if on_processed:
+                        on_processed(futures[future].with_suffix('.dim'))
 
-            # Build GPT command
-            cmd = [
-                self.snap_gpt_path,
-                self.graph_xml,
-                f'-PmyFilename={str(zip_file.absolute())}',
-                f'-PoutputFile={str(output_file.absolute())}',
-                '-c', self.cache_size,
-                '-q', '16'
-            ]
+        logger.info(f"\nProcessed {success_count}/{len(zip_files)} files")
+        return success_count > 0
 
-            try:
+    def _preprocess_scene(self, zip_file: Path, output_file: Path,
+                          cpus: Optional[List[int]] = None) -> bool:
+        """
+        Run SNAP GPT on a single downloaded scene
+
+        Args:
+            zip_file: Sentinel-1 GRD .zip file
+            output_file: Output path without the .dim suffix
+            cpus: Optional CPU ids to pin the GPT process to
+
+        Returns:
+            True if the .dim output was produced, False otherwise
+        """
+        # Build GPT command
+        cmd = [
+            self.snap_gpt_path,
+            self.graph_xml,
+            f'-PmyFilename={str(zip_file.absolute())}',
+            f'-PoutputFile={str(output_file.absolute())}',
+            '-c', self.cache_size,
+            '-q', str(GPT_PARALLELISM)
+        ]
+        if cpus:
+            # taskset rather than preexec_fn, which is unsafe to use from
+            # the worker threads that launch GPT
+            cmd = ['taskset', '-c', ','.join(map(str, cpus))] + cmd
+
+        # GPT is very chatty; its output goes straight to a log file instead
+        # of through Python. The log is removed on success and kept for
+        # inspection on failure.
+        gpt_log = output_file.with_name(output_file.name + '.gpt.log')
+
+        try:
+            with open(gpt_log, 'wb') as log:
                 result = subprocess.run(
                     cmd,
-                    capture_output=True,
-                    text=True,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
                     timeout=3600  # 1 hour timeout
                 )
+            drop_page_cache(zip_file)
 
-                if result.returncode == 0 and output_file.with_suffix('.dim').exists():
-                    logger.info(f"  ✓ Processed successfully")
-                    success_count += 1
-                else:
-                    logger.error(f"  ✗ Processing failed")
-                    if result.stderr:
-                        logger.error(f"  Error: {result.stderr[-500:]}")
+            if result.returncode == 0 and output_file.with_suffix('.dim').exists():
+                logger.info(f"  ✓ Processed successfully: {zip_file.name}")
+                gpt_log.unlink(missing_ok=True)
+                return True
 
-            except subprocess.TimeoutExpired:
-                logger.error(f"  ✗ Processing timeout (>1 hour)")
-            except Exception as e:
-                logger.error(f"  ✗ Error: {e}")
+            logger.error(f"  ✗ Processing failed: {zip_file.name}")
+            with open(gpt_log, 'rb') as log:
+                log.seek(0, os.SEEK_END)
+                log.seek(max(0, log.tell() - 500))
+                tail = log.read().decode('utf-8', errors='replace')
+            if tail:
+                logger.error(f"  Error: {tail}")
+            logger.error(f"  GPT log: {gpt_log}")
+
+        except subprocess.TimeoutExpired:
+            logger.error(f"  ✗ Processing timeout (>1 hour): {zip_file.name}")
+            logger.error(f"  GPT log: {gpt_log}")
+        except Exception as e:
+            logger.error(f"  ✗ Error ({zip_file.name}): {e}")
 
-        logger.info(f"\nProcessed {success_count}/{len(zip_files)} files")
-        return success_count > 0
+        return False
 
     def step2_convert_to_geotiff(self) -> bool:
         """
@@ -149,7 +595,8 @@ class PeriodDirectoryProcessor:
 
         Values are scaled by 100 to preserve 2 decimal places in Int16 format.
         Example: -15.35 dB becomes -1535 (Int16)
-        This matches GEE data format for consistency.
+        This matches GEE data format for consistency. The scaling is also
+        recorded as band scale/offset metadata (scale 0.01).
 
         Returns:
             True if successful, False otherwise
@@ -158,14 +605,11 @@ class PeriodDirectoryProcessor:
         logger.info(f"STEP 2: CONVERT TO GEOTIFF")
         logger.info(f"{'='*70}")
 
-        try:
-            import rasterio
-        except ImportError:
-            logger.error("rasterio not installed. Run: pip install rasterio")
+        if not conversion_available():
             return False
 
         # Get all .dim files
-        dim_files = sorted(self.preprocessed_dir.glob('*.dim'))
+        dim_files = list_files(self.preprocessed_dir, '*.dim')
         if not dim_files:
             logger.warning(f"No preprocessed files found in {self.preprocessed_dir}")
             return False
@@ -173,16 +617,8 @@ class PeriodDirectoryProcessor:
         logger.info(f"Found {len(dim_files)} preprocessed files")
 
         success_count = 0
+        pending = []
         for i, dim_file in enumerate(dim_files, 1):
-            # Find VH data file
-            data_dir = dim_file.with_suffix('.data')
-            vh_file = data_dir / 'Gamma0_VH_db.img'
-
-            if not vh_file.exists():
-                logger.warning(f"[{i}/{len(dim_files)}] VH file not found: {vh_file}")
-                continue
-
-            # Output GeoTIFF
             output_tif = self.geotiff_dir / f"{dim_file.stem}_VH.tif"
 
             if output_tif.exists():
@@ -190,51 +626,186 @@ class PeriodDirectoryProcessor:
                 success_count += 1
                 continue
 
-            logger.info(f"[{i}/{len(dim_files)}] Converting: {dim_file.name}")
-
-            try:
-                with rasterio.open(vh_file) as src:
-                    data = src.read(1)
-                    profile = src.profile.copy()
-
-                    # Scale dB values by 100 to preserve 2 decimal places
-                    # -15.35 dB becomes -1535 (Int16)
-                    # This matches GEE data format
-                    import numpy as np
-
-                    # Handle nodata (0 from SNAP preprocessing)
-                    nodata_mask = (data == 0) | np.isnan(data) | np.isinf(data)
-
-                    # Scale by 100
-                    data_scaled = data * 100
-
-                    # Convert to Int16 with proper nodata
-                    data_int16 = np.clip(data_scaled, -32767, 32767).astype(np.int16)
-                    data_int16[nodata_mask] = -32768
-
-                    # Update profile for GeoTIFF with Int16
-                    profile.update(
-                        driver='GTiff',
-                        dtype='int16',
-                        nodata=-32768,
-                        compress='lzw',
-                        tiled=True,
-                        blockxsize=512,
-                        blockysize=512
-                    )
-
-                    with rasterio.open(output_tif, 'w', **profile) as dst:
-                        dst.write(data_int16, 1)
-
-                logger.info(f"  ✓ Converted (scaled ×100)")
-                success_count += 1
+            pending.append((i, dim_file, output_tif))
 
-            except Exception as e:
-                logger.error(f"  ✗ Conversion failed: {e}")
+        def convert(i: int, dim_file: Path, output_tif: Path) -> bool:
+            logger.info(f"[{i}/{len(dim_files)}] Converting: {dim_file.name}")
+            return self._convert_scene(dim_file, output_tif)
+
+        # rasterio releases the GIL during I/O and compression, so scenes
+        # convert in parallel on threads
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(convert, *item) for item in pending]
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
 
         logger.info(f"\nConverted {success_count}/{len(dim_files)} files")
         return success_count > 0
 
+    def _convert_scene(self, dim_file: Path, output_tif: Path) -> bool:
+        """
+        Convert the VH band of a single .dim product to Int16 GeoTIFF
+
+        Args:
+            dim_file: SNAP BEAM-DIMAP product
+            output_tif: Output GeoTIFF path
+
+        Returns:
+            True if converted, False otherwise
+        """
+        import rasterio
+        import numpy as np
+
+        # Find VH data file
+        data_dir = dim_file.with_suffix('.data')
+        vh_file = data_dir / 'Gamma0_VH_db.img'
+
+        if not vh_file.exists():
+            logger.warning(f"  VH file not found: {vh_file}")
+            return False
+
+        # Write to a temporary name and rename once complete, so an
+        # interrupted run never leaves a truncated GeoTIFF that would be
+        # skipped as already converted
+        part_tif = output_tif.with_name(output_tif.name + '.part')
+
+        try:
+            with rasterio.Env(**GDAL_READ_OPTIONS), rasterio.open(vh_file) as src:
+                # Build the Int16 GeoTIFF profile from scratch rather than
+                # inheriting ENVI driver options from the SNAP source
+                profile = {
+                    'driver': 'GTiff',
+                    'height': src.height,
+                    'width': src.width,
+                    'count': 1,
+                    'dtype': 'int16',
+                    'crs': src.crs,
+                    'transform': src.transform,
+                    'nodata': -32768,
+                    'compress': self.geotiff_compression,
+                    'tiled': True,
+                    'blockxsize': 512,
+                    'blockysize': 512
+                }
+                if self.geotiff_compression != 'none':
+                    # Horizontal differencing compresses dB data better, and
+                    # compression threads are shared with the other workers
+                    profile['predictor'] = 2
+                    profile['num_threads'] = max(1, (os.cpu_count() or 1) // self.workers)
+
+                # Read and Int16 output buffers reused across tiles; kept flat
+                # so smaller edge tiles still get contiguous views
+                block_size = profile['blockysize'] * profile['blockxsize']
+                read_buffer = np.empty(block_size, dtype=src.dtypes[0])
+                int16_buffer = np.empty(block_size, dtype=np.int16)
+
+                # Convert tile by tile so memory stays bounded by the
+                # block size instead of the full scene
+                with rasterio.open(part_tif, 'w', **profile) as dst:
+                    for _, window in dst.block_windows(1):
+                        tile_shape = (window.height, window.width)
+                        tile_size = window.height * window.width
+                        data = src.read(
+                            1, window=window,
+                            out=read_buffer[:tile_size].reshape(tile_shape)
+                        )
+
+                        # Scale dB values by 100 to preserve 2 decimal places
+                        # -15.35 dB becomes -1535 (Int16)
+                        # This matches GEE data format
+
+                        # Handle nodata (0 from SNAP preprocessing, NaN/inf);
+                        # isfinite covers NaN and inf in a single pass
+                        nodata_mask = ~np.isfinite(data)
+                        nodata_mask |= (data == 0)
+
+                        # Scale by 100 (in place on the freshly read tile)
+                        np.multiply(data, DB_SCALE_FACTOR, out=data)
+                        np.clip(data, -32767, 32767, out=data)
+
+                        # Convert to Int16 with proper nodata
+                        data_int16 = int16_buffer[:tile_size].reshape(tile_shape)
+                        np.copyto(data_int16, data, casting='unsafe')
+                        data_int16[nodata_mask] = -32768
+
+                        dst.write(data_int16, 1, window=window)
+
+                    set_db_scale(dst)
+
+            os.replace(part_tif, output_tif)
+            drop_page_cache(vh_file)
+            logger.info(f"  ✓ Converted (scaled ×100): {output_tif.name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"  ✗ Conversion failed: {e}")
+            part_tif.unlink(missing_ok=True)
+            return False
+
+    def step1_2_preprocess_and_convert(self) -> Tuple[bool, bool]:
+        """
+        Run preprocessing and GeoTIFF conversion as an overlapped pipeline
+
+        Converter threads (one per worker) turn each .dim product into a
+        GeoTIFF as soon as SNAP GPT finishes it, so conversion I/O overlaps
+        the next GPT runs instead of waiting for the whole preprocessing step.
+
+        Returns:
+            (preprocessing succeeded, conversion succeeded)
+        """
+        if not conversion_available():
+            return self.step1_preprocess(), False
+
+        dim_queue = queue.Queue()
+        queued = set()
+        converted = []
+
+        def enqueue(dim_file: Path):
+            if dim_file not in queued:
+                queued.add(dim_file)
+                dim_queue.put(dim_file)
+
+        def convert_worker():
+            while True:
+                dim_file = dim_queue.get()
+                if dim_file is None:
+                    break
+
+                output_tif = self.geotiff_dir / f"{dim_file.stem}_VH.tif"
+                if output_tif.exists():
+                    logger.info(f"[convert] Already converted: {output_tif.name}")
+                    converted.append(output_tif)
+                    continue
+
+                logger.info(f"[convert] Converting: {dim_file.name}")
+                if self._convert_scene(dim_file, output_tif):
+                    converted.append(output_tif)
+
+        logger.info("GeoTIFF conversion (step 2) runs alongside preprocessing")
+        converters = [
+            threading.Thread(target=convert_worker, daemon=True)
+            for _ in range(self.workers)
+        ]
+        for converter in converters:
+            converter.start()
+
+        try:
+            preprocess_ok = self.step1_preprocess(on_processed=enqueue)
+
+            # Also convert products that don't come from the current downloads,
+            # matching what the standalone conversion step picks up
+            for dim_file in list_files(self.preprocessed_dir, '*.dim'):
+                enqueue(dim_file)
+        finally:
+            for converter in converters:
+                dim_queue.put(None)
+            for converter in converters:
+                converter.join()
+
+        logger.info(f"\nConverted {len(converted)}/{len(queued)} files")
+        return preprocess_ok, len(converted) > 0
+
     def step3_mosaic(self) -> bool:
         """
         Mosaic all GeoTIFF files using gdal_merge.py
@@ -247,7 +818,7 @@ class PeriodDirectoryProcessor:
         logger.info(f"{'='*70}")
 
         # Get all GeoTIFF files
-        geotiff_files = sorted(self.geotiff_dir.glob('*_VH.tif'))
+        geotiff_files = list_files(self.geotiff_dir, '*_VH.tif')
 
         # Exclude test subdirectory
         geotiff_files = [f for f in geotiff_files if 'test' not in str(f)]
@@ -271,11 +842,36 @@ class PeriodDirectoryProcessor:
 
         # Mosaic with gdal_merge.py
         if len(geotiff_files) == 1:
-            # Single file - just copy
-            logger.info("Single file, copying...")
-            import shutil
-            shutil.copy(geotiff_files[0], output_mosaic)
-            logger.info(f"  ✓ Copied to: {output_mosaic.name}")
+            # Single file - rewrite with gdal_translate so the layout matches
+            # the gdal_merge.py output instead of copying the scene verbatim
+            logger.info("Single file, translating with gdal_translate...")
+
+            cmd = [
+                'gdal_translate',
+                '-ot', 'Int16',
+                '-of', 'GTiff',
+                '-a_nodata', '-32768',
+            ]
+            for option in self._mosaic_creation_options():
+                cmd.extend(['-co', option])
+            cmd.extend([str(geotiff_files[0]), str(output_mosaic)])
+
+            try:
+                subprocess.run(
+                    cmd,
+                    check=True,
+                    capture_output=True,
+                    text=True
+                )
+
+                logger.info(f"  ✓ Translated to: {output_mosaic.name}")
+
+            except subprocess.CalledProcessError as e:
+                logger.error(f"  ✗ gdal_translate failed: {e.stderr}")
+                return False
+            except Exception as e:
+                logger.error(f"  ✗ Translation failed: {e}")
+                return False
         else:
             # Multiple files - use gdal_merge.py
             logger.info(f"Mosaicking {len(geotiff_files)} files with gdal_merge.py...")
@@ -287,14 +883,13 @@ class PeriodDirectoryProcessor:
                 'gdal_merge.py',
                 '-ot', 'Int16',
                 '-of', 'GTiff',
-                '-co', 'COMPRESS=LZW',
-                '-co', 'TILED=YES',
-                '-co', 'BIGTIFF=YES',
                 '-a_nodata', '-32768',
                 '-n', '-32768',  # Input nodata is -32768
                 '-init', '-32768',  # Initialize output with nodata
                 '-o', str(output_mosaic)
             ]
+            for option in self._mosaic_creation_options():
+                cmd.extend(['-co', option])
 
             # Add all input files
             cmd.extend([str(f) for f in geotiff_files])
@@ -317,6 +912,32 @@ class PeriodDirectoryProcessor:
                 logger.error(f"  ✗ Mosaicking failed: {e}")
                 return False
 
+        # Record the dB scaling on the mosaic (gdal_merge.py drops it)
+        try:
+            import rasterio
+            with rasterio.open(output_mosaic, 'r+') as dst:
+                set_db_scale(dst)
+        except Exception as e:
+            logger.warning(f"Could not set mosaic scale metadata: {e}")
+
+        # Build internal overviews, compressed like the mosaic itself
+        try:
+            import rasterio
+            from rasterio.enums import Resampling
+            logger.info("Building mosaic overviews...")
+            with rasterio.Env(COMPRESS_OVERVIEW=self.mosaic_compression.upper(),
+                              PREDICTOR_OVERVIEW=2,
+                              GDAL_TIFF_OVR_BLOCKSIZE=512,
+                              GDAL_NUM_THREADS='ALL_CPUS'):
+                with rasterio.open(output_mosaic, 'r+') as dst:
+                    factors = [f for f in MOSAIC_OVERVIEW_FACTORS
+                               if min(dst.height, dst.width) // f >= 256]
+                    if factors:
+                        dst.build_overviews(factors, Resampling.average)
+                        dst.update_tags(ns='rio_overview', resampling='average')
+        except Exception as e:
+            logger.warning(f"Could not build mosaic overviews: {e}")
+
         # Verify mosaic
         try:
             import rasterio
@@ -332,6 +953,10 @@ class PeriodDirectoryProcessor:
 
         return True
 
+    def _mosaic_creation_options(self) -> List[str]:
+        """GDAL creation options for the mosaic, including its compression"""
+        return [f'COMPRESS={self.mosaic_compression.upper()}'] + MOSAIC_CREATION_OPTIONS
+
     def step4_create_preview(self) -> bool:
         """
         Create a preview image of the mosaic
@@ -346,7 +971,7 @@ class PeriodDirectoryProcessor:
         try:
             import rasterio
             import numpy as np
-            import matplotlib.pyplot as plt
+            from matplotlib.figure import Figure
         except ImportError as e:
             logger.error(f"Required packages not installed: {e}")
             return False
@@ -377,8 +1002,13 @@ class PeriodDirectoryProcessor:
                 if nodata is not None:
                     data = np.ma.masked_equal(data, nodata)
 
-            # Create preview figure
-            fig, ax = plt.subplots(figsize=(14, 8))
+                # Back to dB using the band scale/offset (Int16 x100 mosaics)
+                data = data * src.scales[0] + src.offsets[0]
+
+            # Create preview figure (without pyplot, so no GUI backend is
+            # loaded and the figure is freed once it goes out of scope)
+            fig = Figure(figsize=(14, 8))
+            ax = fig.subplots()
 
             # Plot with geographic extent
             extent = [bounds.left, bounds.right, bounds.bottom, bounds.top]
@@ -389,13 +1019,12 @@ class PeriodDirectoryProcessor:
             ax.set_title(f'{period_name.upper()} Mosaic\nSentinel-1 VH Backscatter (dB)')
 
             # Add colorbar
-            cbar = plt.colorbar(im, ax=ax, shrink=0.8)
+            cbar = fig.colorbar(im, ax=ax, shrink=0.8)
             cbar.set_label('VH Backscatter (dB)')
 
             # Save preview
             preview_path = self.mosaic_dir / f"{period_name}_preview.png"
-            plt.savefig(preview_path, dpi=150, bbox_inches='tight')
-            plt.close()
+            fig.savefig(preview_path, dpi=150, bbox_inches='tight')
 
             logger.info(f"  ✓ Preview saved: {preview_path.name}")
             return True
@@ -410,12 +1039,11 @@ class PeriodDirectoryProcessor:
         logger.info(f"PROCESSING PERIOD DIRECTORY: {self.period_dir.name}")
         logger.info(f"{'='*70}")
 
-        # Step 1: Preprocess
-        if not self.step1_preprocess():
+        # Steps 1 + 2: Preprocess and convert to GeoTIFF (overlapped)
+        preprocess_ok, convert_ok = self.step1_2_preprocess_and_convert()
+        if not preprocess_ok:
             logger.error("Preprocessing failed or skipped")
-
-        # Step 2: Convert to GeoTIFF
-        if not self.step2_convert_to_geotiff():
+        if not convert_ok:
             logger.error("Conversion failed or skipped")
 
         # Step 3: Mosaic
@@ -451,6 +1079,9 @@ Examples:
 
   # Specify directory
   python s1_process_period_dir.py --period-dir path/to/p15 --run-all
+
+  # Preprocess two scenes at a time with 8G SNAP cache each
+  python s1_process_period_dir.py --run-all --workers 2 --cache-size 8G
         """
     )
 
@@ -463,7 +1094,25 @@ Examples:
                         default='/home/unika_sianturi/work/rice-growth-stage-mapping/sen1_preprocessing-gpt.xml',
                         help='SNAP processing graph XML file')
     parser.add_argument('--cache-size', default='16G',
-                        help='SNAP cache size (default: 16G)')
+                        help='SNAP cache size per GPT process (default: 16G)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of scenes preprocessed and converted '
+                             'concurrently; each GPT process uses --cache-size '
+                             'memory. Use 0 to estimate from available memory '
+                             'and CPUs (default: 1)')
+    parser.add_argument('--geotiff-compression', default='lzw',
+                        choices=['lzw', 'none'],
+                        help='Compression of per-scene GeoTIFFs; "none" trades '
+                             'disk space for faster conversion and mosaicking '
+                             '(default: lzw)')
+    parser.add_argument('--mosaic-compression', default='lzw',
+                        choices=['lzw', 'zstd'],
+                        help='Compression of the mosaic; "zstd" gives smaller '
+                             'files that decode faster but needs GDAL >= 2.3 '
+                             'to read (default: lzw)')
+    parser.add_argument('--pin-cpus', action='store_true',
+                        help='Pin each concurrent GPT process to its own set of '
+                             'CPUs (Linux only, used with --workers > 1)')
 
     # Actions
     parser.add_argument('--preprocess', action='store_true',
@@ -484,7 +1133,11 @@ Examples:
         period_dir=args.period_dir,
         snap_gpt_path=args.snap_gpt_path,
         graph_xml=args.graph_xml,
-        cache_size=args.cache_size
+        cache_size=args.cache_size,
+        workers=args.workers,
+        geotiff_compression=args.geotiff_compression,
+        mosaic_compression=args.mosaic_compression,
+        pin_cpus=args.pin_cpus
     )
 
     # Execute requested actions (supports multiple flags)